@@ -7,12 +7,13 @@
 
 # type annotations
 from __future__ import annotations
-from typing import IO
+from typing import IO, List, Tuple
 
 # standard libs
 import os
 import sys
 import json
+import functools
 from getpass import getuser
 
 # external libs
@@ -20,7 +21,8 @@ from cmdkit.app import Application, exit_status
 from cmdkit.cli import Interface
 from cmdkit.config import Configuration
 from cmdkit.namespace import Namespace
-from cmdkit.logging import Logger, logging_styles, level_by_name
+from cmdkit.platform import AppContext
+from cmdkit.logging import Logger, logging_styles, level_by_name, DEFAULT_LOGGING_STYLE, INFO
 
 # metadata
 version = '0.1.0'
@@ -37,24 +39,23 @@ default_config = Namespace({
 })
 
 
-try:
+def bootstrap() -> Tuple[AppContext, Configuration, Logger]:
+    """Load configuration and initialize logging."""
     ctx, cfg = Configuration.from_context(name=appname, default_config=default_config)
-    log = Logger.default(program,
-                         level=level_by_name[cfg.logging.level.upper()],
-                         format=logging_styles[cfg.logging.style.lower()]['format'])
-except Exception as error:
-    print(f'error: {program}: {error}', file=sys.stderr)
-    sys.exit(exit_status.bad_config)
+    level = level_by_name.get(cfg.logging.level.upper(), INFO)
+    style = logging_styles.get(cfg.logging.style.casefold(), logging_styles[DEFAULT_LOGGING_STYLE])
+    log = Logger.default(program, level=level, format=style['format'])
+    return ctx, cfg, log
 
 
-usage_text = f"""\
+USAGE_TEMPLATE = """\
 Usage:
   {program} [-v] [NAME | --config | --site] [-o FILE]
-  {__doc__}\
+  {description}\
 """
 
-help_text = f"""\
-{usage_text}
+HELP_TEMPLATE = """\
+{usage}
 
 Arguments:
   NAME                  Name of person to greet (default: $USER).
@@ -68,64 +69,90 @@ Options:
 """
 
 
-site_text = f"""\
-[system]
-data:   {ctx.path.system.lib}
-logs:   {ctx.path.system.log}
-config: {ctx.path.system.config}
+@functools.cache
+def usage_text() -> str:
+    """Usage statement for program."""
+    return USAGE_TEMPLATE.format(program=program, description=__doc__)
 
-[user]
-data:   {ctx.path.user.lib}
-logs:   {ctx.path.user.log}
-config: {ctx.path.user.config}
 
-[local]
-data:   {ctx.path.local.lib}
-logs:   {ctx.path.local.log}
-config: {ctx.path.local.config}
-"""
+@functools.cache
+def help_text() -> str:
+    """Help statement for program."""
+    return HELP_TEMPLATE.format(usage=usage_text())
+
 
-site_text = site_text.replace(
-    f'[{ctx.default_site}]',
-    f'[{ctx.default_site}] (default)',
-)
+def format_site_text(ctx: AppContext) -> str:
+    """Show site paths for the given application context."""
+    sections = []
+    for site in ('system', 'user', 'local'):
+        header = f'[{site}]' if site != ctx.default_site else f'[{site}] (default)'
+        sections.append(f"""\
+{header}
+data:   {ctx.path[site].lib}
+logs:   {ctx.path[site].log}
+config: {ctx.path[site].config}
+""")
+    return '\n'.join(sections)
 
 
 class FullHello(Application):
     """Application class for program."""
 
-    interface = Interface(program, usage_text, help_text)
-    interface.add_argument('-v', '--version', action='version', version=version)
+    interface: Interface = None
 
     name: str = getuser()
-    interface.add_argument('name', nargs='?', default=name)
-
     show_config: bool = False
     show_site: bool = False
-    mode = interface.add_mutually_exclusive_group()
-    mode.add_argument('-c', '--config', action='store_true', dest='show_config')
-    mode.add_argument('-s', '--site', action='store_true', dest='show_site')
-
     outpath: str = '-'
-    output_stream: IO = sys.stdout
-    interface.add_argument('-o', '--output', dest='outpath', default=outpath)
+    output_stream: IO = None
+
+    ctx: AppContext = None
+    cfg: Configuration = None
+    log: Logger = None
+
+    @classmethod
+    def build_interface(cls) -> Interface:
+        """Define command-line interface (only when the program is actually run)."""
+        interface = Interface(program, usage_text(), help_text())
+        interface.add_argument('-v', '--version', action='version', version=version)
+        interface.add_argument('name', nargs='?', default=cls.name)
+        mode = interface.add_mutually_exclusive_group()
+        mode.add_argument('-c', '--config', action='store_true', dest='show_config')
+        mode.add_argument('-s', '--site', action='store_true', dest='show_site')
+        interface.add_argument('-o', '--output', dest='outpath', default=cls.outpath)
+        return interface
+
+    @classmethod
+    def configure(cls, ctx: AppContext, cfg: Configuration, log: Logger) -> None:
+        """Attach application context, configuration, and logger."""
+        cls.ctx, cls.cfg, cls.log = ctx, cfg, log
+
+    @classmethod
+    def main(cls, cmdline: List[str] = None, shared: Namespace = None) -> int:
+        """Build interface on first use before handing off to the application."""
+        if cls.interface is None:
+            cls.interface = cls.build_interface()
+        return super().main(cmdline, shared)
 
     def run(self: FullHello) -> None:
         """Run program."""
         if self.show_config:
-            log.info('Showing configuration')
-            print(json.dumps(dict(cfg), indent=4), file=self.output_stream)
+            self.log.info('Showing configuration')
+            json.dump(dict(self.cfg), self.output_stream, indent=4)
+            self.output_stream.write('\n')
         elif self.show_site:
-            log.info('Showing site details')
-            print(site_text, file=self.output_stream)
+            self.log.info('Showing site details')
+            print(format_site_text(self.ctx), file=self.output_stream)
         else:
-            log.info(f'Greeting user ({self.name})')
+            self.log.info(f'Greeting user ({self.name})')
             print(f'Hello, {self.name}!', file=self.output_stream)
 
     def __enter__(self: FullHello) -> Application:
-        """Open output file path."""
-        if self.outpath != '-':
-            self.output_stream = open(self.outpath, mode='w')
+        """Open output file path (resolve standard output at run time)."""
+        if self.outpath == '-':
+            self.output_stream = sys.stdout
+        else:
+            self.output_stream = open(self.outpath, mode='w', buffering=64 * 1024)
         return super().__enter__()
 
     def __exit__(self: FullHello, *exc) -> None:
@@ -135,4 +162,9 @@ class FullHello(Application):
 
 
 if __name__ == '__main__':
+    try:
+        FullHello.configure(*bootstrap())
+    except Exception as error:
+        print(f'error: {program}: {error}', file=sys.stderr)
+        sys.exit(exit_status.bad_config)
     sys.exit(FullHello.main(sys.argv[1:]))
@@ -7,26 +7,28 @@
 
 # type annotations
 from __future__ import annotations
+from typing import List
 
 # standard libs
 import os
 import sys
+import functools
 
 # external libs
-from cmdkit import Application, Interface
+from cmdkit import Application, Interface, Namespace
 
 # metadata
 version = '0.1.0'
 
 prog_name = os.path.basename(sys.argv[0])
-usage_text = f"""\
+USAGE_TEMPLATE = """\
 Usage:
-  {prog_name} [-v] NAME
-  {__doc__}\
+  {program} [-v] NAME
+  {description}\
 """
 
-help_text = f"""\
-{usage_text}
+HELP_TEMPLATE = """\
+{usage}
 
 Arguments:
   NAME                  Name of person to greet.
@@ -37,14 +39,39 @@ Options:
 """
 
 
+@functools.cache
+def usage_text() -> str:
+    """Usage statement for program."""
+    return USAGE_TEMPLATE.format(program=prog_name, description=__doc__)
+
+
+@functools.cache
+def help_text() -> str:
+    """Help statement for program."""
+    return HELP_TEMPLATE.format(usage=usage_text())
+
+
 class TinyApp(Application):
     """Application class for tiny-script program."""
 
-    interface = Interface(prog_name, usage_text, help_text)
-    interface.add_argument('-v', '--version', action='version', version=version)
+    interface: Interface = None
 
     name: str
-    interface.add_argument('name')
+
+    @classmethod
+    def build_interface(cls) -> Interface:
+        """Define command-line interface (only when the program is actually run)."""
+        interface = Interface(prog_name, usage_text(), help_text())
+        interface.add_argument('-v', '--version', action='version', version=version)
+        interface.add_argument('name')
+        return interface
+
+    @classmethod
+    def main(cls, cmdline: List[str] = None, shared: Namespace = None) -> int:
+        """Build interface on first use before handing off to the application."""
+        if cls.interface is None:
+            cls.interface = cls.build_interface()
+        return super().main(cmdline, shared)
 
     def run(self: TinyApp) -> None:
         """Run program."""
@@ -4,9 +4,11 @@
 """Package initialization for CmdKit."""
 
 
+# type annotations
+from typing import Any
+
 # standard libs
-from logging import NullHandler
-from importlib.metadata import version as get_version
+from logging import getLogger, NullHandler
 
 # internal libs
 from cmdkit.cli import Interface, ArgumentError
@@ -26,8 +28,14 @@ __all__ = [
     'Logger', 'logging_styles', 'DEFAULT_LOGGING_STYLE'
 ]
 
-# package metadata
-__version__ = get_version('cmdkit')
-
 # null-handler for library interface
-Logger.with_name(__name__).addHandler(NullHandler())
+getLogger(__name__).addHandler(NullHandler())
+
+
+def __getattr__(name: str) -> Any:
+    """Package metadata (i.e., `__version__`) is read from the installed distribution on first access."""
+    if name == '__version__':
+        from importlib.metadata import version
+        globals()['__version__'] = version('cmdkit')
+        return globals()['__version__']
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -6,7 +6,7 @@
 
 # type annotations
 from __future__ import annotations
-from typing import Callable
+from typing import Callable, Final
 
 # standard libs
 import os
@@ -23,18 +23,12 @@ __all__ = ['NO_COLOR', 'FORCE_COLOR', 'COLOR_STDOUT', 'COLOR_STDERR', 'Ansi', 'f
 
 
 # Enable/disable colors if necessary
-NO_COLOR = False if not os.getenv('NO_COLOR') else True
-FORCE_COLOR = False if not os.getenv('FORCE_COLOR') else True
+NO_COLOR = bool(os.getenv('NO_COLOR'))
+FORCE_COLOR = bool(os.getenv('FORCE_COLOR'))
 
-COLOR_STDOUT = True
-COLOR_STDERR = True
-if not sys.stdout.isatty() or NO_COLOR:
-    COLOR_STDOUT = False
-if not sys.stderr.isatty() or NO_COLOR:
-    COLOR_STDERR = False
-if FORCE_COLOR:
-    COLOR_STDOUT = True
-    COLOR_STDERR = True
+# NOTE: only query the terminal if the environment has not already decided
+COLOR_STDOUT = FORCE_COLOR or (not NO_COLOR and sys.stdout.isatty())
+COLOR_STDERR = FORCE_COLOR or (not NO_COLOR and sys.stderr.isatty())
 
 
 class Ansi(Enum):
@@ -56,6 +50,10 @@ class Ansi(Enum):
     WHITE = '\033[37m'
 
 
+# Bound once for use in formatting methods
+_RESET: Final[str] = Ansi.RESET.value
+
+
 def format_ansi(seq: Ansi, text: str) -> str:
     """
     Apply escape sequence with reset afterward, if necessary.
@@ -64,25 +62,42 @@ def format_ansi(seq: Ansi, text: str) -> str:
     """
     if not COLOR_STDOUT:
         return text
-    elif text.endswith(Ansi.RESET.value):
+    elif text.endswith(_RESET):
         return f'{seq.value}{text}'
     else:
-        return f'{seq.value}{text}{Ansi.RESET.value}'
+        return f'{seq.value}{text}{_RESET}'
+
+
+def _shorthand(seq: Ansi) -> Callable[[str], str]:
+    """Build equivalent of `functools.partial(format_ansi, seq)` with escape sequences bound directly."""
+    prefix = seq.value
+
+    def shorthand(text: str) -> str:
+        if not COLOR_STDOUT:
+            return text
+        elif text.endswith(_RESET):
+            return prefix + text
+        else:
+            return prefix + text + _RESET
+
+    shorthand.__name__ = shorthand.__qualname__ = seq.name.lower()
+    shorthand.__doc__ = f'Apply :attr:`Ansi.{seq.name}` to `text` (see :func:`format_ansi`).'
+    return shorthand
 
 
 # shorthand formatting methods
-bold = functools.partial(format_ansi, Ansi.BOLD)
-faint = functools.partial(format_ansi, Ansi.FAINT)
-italic = functools.partial(format_ansi, Ansi.ITALIC)
-underline = functools.partial(format_ansi, Ansi.UNDERLINE)
-black = functools.partial(format_ansi, Ansi.BLACK)
-red = functools.partial(format_ansi, Ansi.RED)
-green = functools.partial(format_ansi, Ansi.GREEN)
-yellow = functools.partial(format_ansi, Ansi.YELLOW)
-blue = functools.partial(format_ansi, Ansi.BLUE)
-magenta = functools.partial(format_ansi, Ansi.MAGENTA)
-cyan = functools.partial(format_ansi, Ansi.CYAN)
-white = functools.partial(format_ansi, Ansi.WHITE)
+bold = _shorthand(Ansi.BOLD)
+faint = _shorthand(Ansi.FAINT)
+italic = _shorthand(Ansi.ITALIC)
+underline = _shorthand(Ansi.UNDERLINE)
+black = _shorthand(Ansi.BLACK)
+red = _shorthand(Ansi.RED)
+green = _shorthand(Ansi.GREEN)
+yellow = _shorthand(Ansi.YELLOW)
+blue = _shorthand(Ansi.BLUE)
+magenta = _shorthand(Ansi.MAGENTA)
+cyan = _shorthand(Ansi.CYAN)
+white = _shorthand(Ansi.WHITE)
 
 
 def colorize_usage(text: str) -> str:
@@ -96,82 +111,39 @@ def colorize_usage(text: str) -> str:
     if not COLOR_STDOUT:  # NOTE: usage is on stdout not stderr
         return text
     else:
-        return _apply_formatters(text,
-                                 _format_headers,
-                                 _format_options,
-                                 _format_special_device,
-                                 _format_special_metavars,
-                                 _format_special_reserved_names,
-                                 _format_single_quoted_string,
-                                 _format_double_quoted_string,
-                                 _format_backtick_string,
-                                 _format_digit,
-                                 )
-
-
-def _apply_formatters(text: str, *formatters: Callable[[str], str]) -> str:
-    """Apply all text `formatters`."""
-    if formatters:
-        return formatters[0](_apply_formatters(text, *formatters[1:]))
-    else:
-        return text
-
-
-# Look-around pattern to negate matches within quotation marks
-# Whole quotations are formatted together
-NOT_QUOTED = (
-    r'(?=([^"]*"[^"]*")*[^"]*$)' +
-    r"(?=([^']*'[^']*')*[^']*$)" +
-    r'(?=([^`]*`[^`]*`)*[^`]*$)'
-)
-
-
-def _format_headers(text: str) -> str:
-    """Add rich ANSI formatting to section headers."""
-    return re.sub(r'^(?P<name>[A-Z][a-z]+):' + NOT_QUOTED, bold(r'\g<name>:'),
-                  text, flags=re.MULTILINE)
-
-
-def _format_options(text: str) -> str:
-    """Add rich ANSI formatting to option syntax."""
-    option_pattern = r'(?P<leader>[ /\[,])(?P<option>-[a-zA-Z]+|--[a-z]+(-[a-z]+)?)\b'
-    return re.sub(option_pattern + NOT_QUOTED, r'\g<leader>' + cyan(r'\g<option>'), text)
-
-
-def _format_special_metavars(text: str) -> str:
-    """Add rich ANSI formatting to special argument syntax."""
-    metavars_pattern = r'(?<!-)\b(?P<arg>[A-Z]{2,})\b'
-    return re.sub(metavars_pattern + NOT_QUOTED, italic(r'\g<arg>'), text)
-
-
-def _format_special_device(text: str) -> str:
-    """Add rich ANSI formatting to special device/resource names (e.g., '<stdout>')."""
-    return re.sub(r'(?P<arg><[a-z]{3,}>)' + NOT_QUOTED, italic(r'\g<arg>'), text)
-
-
-def _format_special_reserved_names(text: str) -> str:
-    """Special reserved names (e.g., localhost)."""
-    names = ['localhost', 'stdin', 'stdout', 'stderr', ]
-    names_pattern = r'(?<!-)\b(?P<name>' + '|'.join(names) + r')\b'
-    return re.sub(names_pattern + NOT_QUOTED, italic(r'\g<name>'), text)
-
-
-def _format_single_quoted_string(text: str) -> str:
-    """Add rich ANSI formatting to quoted strings."""
-    return re.sub(r"'(?P<subtext>.*)'", yellow(r"'\g<subtext>'"), text)
-
-
-def _format_double_quoted_string(text: str) -> str:
-    """Add rich ANSI formatting to quoted strings."""
-    return re.sub(r'"(?P<subtext>.*)"', yellow(r'"\g<subtext>"'), text)
-
-
-def _format_backtick_string(text: str) -> str:
-    """Add rich ANSI formatting to quoted strings."""
-    return re.sub(r'`(?P<subtext>.*)`', yellow(r'`\g<subtext>`'), text)
-
-
-def _format_digit(text: str) -> str:
-    """Add rich ANSI formatting to numerical digits."""
-    return re.sub(r'\b(?P<num>\d+\.?[kmgtKMGT]?[bB]?|null|NULL)\b' + NOT_QUOTED,
-                  green(r'\g<num>'), text)
+        return _colorize_usage(text)
+
+
+@functools.lru_cache(maxsize=256)
+def _colorize_usage(text: str) -> str:
+    """Apply formatting for :func:`colorize_usage` (cached as the same text is often formatted repeatedly)."""
+    return _USAGE_PATTERN.sub(_format_usage_match, text)
+
+
+# Syntax highlighted by `colorize_usage` in a single pass over the text.
+# Alternatives are tried in order at each position, so whole quotations
+# are consumed (and formatted together) before anything within them can match.
+_USAGE_PATTERN = re.compile('|'.join([
+    r'(?P<quoted>(?P<quote>[\'"`]).*?(?P=quote))',
+    r'(?P<header>^[A-Z][a-z]+:)',
+    r'(?P<option>(?<=[ /\[,])(?:-[a-zA-Z]+|--[a-z]+(?:-[a-z]+)?)\b)',
+    r'(?P<device><[a-z]{3,}>)',
+    r'(?P<reserved>(?<!-)\b(?:localhost|stdin|stdout|stderr)\b)',
+    r'(?P<digit>\b(?:\d+\.?[kmgtKMGT]?[bB]?|null|NULL)\b)',
+    r'(?P<metavar>(?<!-)\b[A-Z]{2,}\b)',
+]), re.MULTILINE)
+
+_USAGE_STYLE = {
+    'quoted': Ansi.YELLOW.value,
+    'header': Ansi.BOLD.value,
+    'option': Ansi.CYAN.value,
+    'device': Ansi.ITALIC.value,
+    'reserved': Ansi.ITALIC.value,
+    'digit': Ansi.GREEN.value,
+    'metavar': Ansi.ITALIC.value,
+}
+
+
+def _format_usage_match(match: re.Match) -> str:
+    """Wrap matched usage syntax with the escape sequence for its kind."""
+    return f'{_USAGE_STYLE[match.lastgroup]}{match.group()}{_RESET}'
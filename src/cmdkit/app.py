@@ -100,16 +100,16 @@ class Application(abc.ABC):
             :data:`~Application.exceptions`
         """
         try:
-            if not cmdline:
-                if hasattr(cls, 'ALLOW_NOARGS') and cls.ALLOW_NOARGS is True:
-                    pass
-                else:
-                    cls.handle_usage(cls.interface.usage_text)
-                    return exit_status.usage
+            if not cmdline and not cls.ALLOW_NOARGS:
+                cls.handle_usage(cls.interface.usage_text)
+                return exit_status.usage
 
             with cls.from_cmdline(cmdline) as app:
                 if shared is not None:
-                    app.shared = Namespace(shared) if not app.shared else Namespace({**shared, **app.shared})
+                    merged = dict(shared)
+                    if app.shared:
+                        merged.update(app.shared)
+                    app.shared = Namespace(merged)
                 app.run()
 
             return exit_status.success
@@ -131,9 +131,10 @@ class Application(abc.ABC):
             return exit_status.keyboard_interrupt
 
         except Exception as error:
-            for exc_type, exc_handler in cls.exceptions.items():
-                if isinstance(error, exc_type):
-                    return exc_handler(error)
+            if cls.exceptions:
+                for exc_type, exc_handler in cls.exceptions.items():
+                    if isinstance(error, exc_type):
+                        return exc_handler(error)
             cls.log_exception('uncaught exception occurred!')
             raise
 
@@ -175,7 +176,7 @@ class ApplicationGroup(Application):
         if not cmdline:
             return super(ApplicationGroup, cls).from_cmdline(cmdline)
         else:
-            if cls.ALLOW_PARSE is True and not any(arg in cmdline for arg in {'-h', '--help'}):
+            if cls.ALLOW_PARSE is True and '-h' not in cmdline and '--help' not in cmdline:
                 known, remainder = cls.interface.parse_known_intermixed_args(cmdline)
                 self = super(ApplicationGroup, cls).from_namespace(known)
                 self.cmdline = remainder
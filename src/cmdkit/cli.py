@@ -47,6 +47,11 @@ def _version_action(self, parser, namespace, values, option_string=None) -> None
 _argparse._VersionAction.__call__ = _version_action   # noqa: (protected)
 
 
+def _needs_formatting(text: str) -> bool:
+    """Empty text or text already containing escape sequences is taken as-is."""
+    return bool(text) and '\033[' not in text
+
+
 class Interface(_argparse.ArgumentParser):
     """
     Variant of :class:`argparse.ArgumentParser` that raises an :class:`ArgumentError`
@@ -56,6 +61,7 @@ class Interface(_argparse.ArgumentParser):
     The `usage_text` and `help_text` are taken verbatim; however, these text values
     can be colorized automatically using a generalized syntax highlighter
     (:meth:`cmdkit.ansi.colorize_usage` by default).
+    Empty text, or text that already contains escape sequences, is left as-is.
     To disable this behavior, use the `disable_colors` parameter.
     """
 
@@ -72,10 +78,25 @@ class Interface(_argparse.ArgumentParser):
             self.usage_text = usage_text
             self.help_text = help_text
         else:
-            self.usage_text = formatter(usage_text)
-            self.help_text = formatter(help_text)
+            self.usage_text = usage_text if not _needs_formatting(usage_text) else formatter(usage_text)
+            self._help_text = help_text
+            self._help_formatter = formatter if _needs_formatting(help_text) else None
         super().__init__(prog=program, usage=usage_text, **kwargs)
 
+    @property
+    def help_text(self) -> str:
+        """Help text, formatted on first access (most invocations never print it)."""
+        if self._help_formatter is not None:
+            self._help_text = self._help_formatter(self._help_text)
+            self._help_formatter = None
+        return self._help_text
+
+    @help_text.setter
+    def help_text(self, value: str) -> None:
+        """Assigned help text is taken verbatim."""
+        self._help_text = value
+        self._help_formatter = None
+
     # prevents base class from trying to build up usage text
     def format_help(self) -> str:
         return self.help_text
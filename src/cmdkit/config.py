@@ -10,10 +10,15 @@ local files and your environment.
 
 # type annotations
 from __future__ import annotations
-from typing import Tuple, List, Dict, TypeVar, Callable, Union, Any
+from typing import Tuple, List, Dict, FrozenSet, TypeVar, Callable, Iterator, Union, Optional, Final, Any
 
 # standard libs
-from collections import Counter
+import os
+import copy
+import struct
+import pickle
+import hashlib
+import tempfile
 
 # internal libs
 from cmdkit.namespace import NSCoreMixin, Namespace, Environ, _find_the_leaves
@@ -33,6 +38,100 @@ class ConfigurationError(Exception):
     """Exception specific to configuration errors."""
 
 
+# Parsed files by absolute path, with the (mtime, size) at the time of parsing
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int], Namespace]] = {}
+
+
+# Persistent cache files start with a header identifying the format and the cmdkit version
+# that wrote them, followed by the (mtime, size) of their source file
+_CACHE_FORMAT = b'cmdkit-config-cache/1'
+_CACHE_STAMP = struct.Struct('<qq')
+
+
+def _persistent_cache_header(stamp: Tuple[int, int]) -> bytes:
+    """Header expected for a persistent cache file written now, for a source with `stamp`."""
+    try:
+        import cmdkit
+        version = cmdkit.__version__
+    except Exception:  # NOTE: not installed (e.g., running from source)
+        version = 'unknown'
+    return b'\0'.join([_CACHE_FORMAT, version.encode(), _CACHE_STAMP.pack(*stamp)])
+
+
+def _persistent_cache_enabled() -> bool:
+    """Parsed files are persisted across processes only if CMDKIT_CONFIG_CACHE=1."""
+    return os.getenv('CMDKIT_CONFIG_CACHE') == '1'
+
+
+def _persistent_cache_path(path: str) -> Optional[str]:
+    """Location of persistent cache file for `path` (None if cache directory is not private)."""
+    uid = os.getuid() if hasattr(os, 'getuid') else None
+    cache_dir = os.path.join(tempfile.gettempdir(), 'cmdkit-cfg' if uid is None else f'cmdkit-cfg-{uid}')
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    if uid is not None:
+        info = os.lstat(cache_dir)
+        if info.st_uid != uid or info.st_mode & 0o077:
+            return None  # NOTE: never unpickle files others could have written
+    return os.path.join(cache_dir, hashlib.blake2b(path.encode()).hexdigest() + '.pkl')
+
+
+def _load_persistent(path: str, stamp: Tuple[int, int]) -> Optional[Namespace]:
+    """Load namespace for `path` from persistent cache (None if missing or out of date)."""
+    try:
+        cache_path = _persistent_cache_path(path)
+        if cache_path is None:
+            return None
+        header = _persistent_cache_header(stamp)
+        with open(cache_path, mode='rb') as source:
+            if source.read(len(header)) != header:
+                return None
+            return pickle.load(source)
+    except Exception:  # NOTE: e.g., refers to classes from another version, parse the file instead
+        return None
+
+
+def _store_persistent(path: str, stamp: Tuple[int, int], ns: Namespace) -> None:
+    """Atomically write namespace for `path` to persistent cache (failures are ignored)."""
+    try:
+        cache_path = _persistent_cache_path(path)
+        if cache_path is None:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, mode='wb') as output:
+                output.write(_persistent_cache_header(stamp))
+                pickle.dump(ns, output, protocol=5)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception:
+        pass
+
+
+def _load_local(filepath: str) -> Namespace:
+    """Load namespace from `filepath` (if it exists), reusing the parsed result if the file has not changed."""
+    try:
+        stat = os.stat(filepath)
+    except OSError:
+        return Namespace()  # NOTE: same as `os.path.exists`, e.g., a path under a regular file
+    path, stamp = os.path.abspath(filepath), (stat.st_mtime_ns, stat.st_size)
+    cached = _PARSE_CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        persistent = _persistent_cache_enabled()
+        ns = None if not persistent else _load_persistent(path, stamp)
+        if ns is None:
+            ns = Namespace.from_local(filepath)
+            if persistent:
+                _store_persistent(path, stamp, ns)
+        cached = _PARSE_CACHE[path] = stamp, ns
+    return copy.deepcopy(cached[1])  # NOTE: callers may modify their copy
+
+
+# Attributes of Configuration itself, never treated as parameters
+_INTERNAL_ATTRIBUTES: Final[FrozenSet[str]] = frozenset({'local', 'namespaces'})
+
+
 class Configuration(NSCoreMixin):
     """
     An ordered collection of `Namespace` dictionaries.
@@ -88,8 +187,9 @@ class Configuration(NSCoreMixin):
         """
         for name, mapping in others.items():
             if name != '_':
-                self.namespaces[name] = Namespace(mapping)
-                super().update(self.namespaces[name])
+                namespace = Namespace(mapping)
+                dict.__setitem__(self.namespaces, name, namespace)  # NOTE: already converted, skip second copy
+                super().update(namespace)
             else:
                 self.local.update(mapping)
 
@@ -107,15 +207,30 @@ class Configuration(NSCoreMixin):
             ...                                 system='/etc/myapp.yml',
             ...                                 user=f'{HOME}/.myapp.yml',
             ...                                 local=f'{CWD}/.myapp.yml')
+
+        Files are only parsed again if their modification time or size has changed
+        since they were last loaded (see :meth:`clear_parse_cache`).
+        Set ``CMDKIT_CONFIG_CACHE=1`` in the environment to also keep parsed files
+        in a private per-user temporary directory, shared across processes.
         """
         default_ = Namespace() if not default else Namespace(default)
         cfg = cls(default=default_)
         for label, filepath in files.items():
-            cfg.extend(**{label: Namespace.from_local(filepath, ignore_if_missing=True)})
+            cfg.extend(**{label: _load_local(filepath)})
         if env:
             cfg.extend(env=Environ(prefix).reduce())
         return cfg
 
+    @staticmethod
+    def clear_parse_cache() -> None:
+        """
+        Forget previously parsed files.
+
+        Files loaded by :meth:`from_local` are only parsed again if their modification
+        time or size has changed. Use this method to force a fresh read.
+        """
+        _PARSE_CACHE.clear()
+
     @classmethod
     def from_context(cls,
                      name: str,
@@ -147,6 +262,11 @@ class Configuration(NSCoreMixin):
                            default=default_config)
         )
 
+    def _iter_namespaces(self) -> Iterator[Tuple[str, Namespace]]:
+        """Iterate over member namespaces in order, followed by the `local` namespace as "_"."""
+        yield from self.namespaces.items()
+        yield '_', self.local
+
     def which(self, *path: str) -> str:
         """
         Derive which member namespace takes precedent for the given variable.
@@ -179,10 +299,8 @@ class Configuration(NSCoreMixin):
             >>> conf.a
             Namespace({'x': 1, 'y': 3})
         """
-        namespaces = Namespace({**self.namespaces, '_': self.local})
-        for label in reversed(list(namespaces.keys())):
+        for label, sub in reversed(list(self._iter_namespaces())):
             try:
-                sub = namespaces[label]
                 for p in path:
                     sub = sub[p]
                 return label
@@ -203,9 +321,15 @@ class Configuration(NSCoreMixin):
             >>> cfg.duplicates()
             {'x': {'one': [('a',), ('b',)], 'two': [('b',)]}, 'z': {'one': [('b',)], 'two': [('b',)]}}
         """
-        namespaces = Namespace({**self.namespaces, '_': self.local})
-        tips = [tip for _, (*_, tip) in _find_the_leaves(namespaces)]
-        return {tip: self.whereis(tip) for tip, count in Counter(tips).items() if count > 1}
+        labels = [*self.namespaces, '_']
+        places: Dict[str, Dict[str, List[Tuple[str, ...]]]] = {}
+        for label, space in self._iter_namespaces():
+            for branch in _find_the_leaves(space):
+                tip = branch.stem[-1]
+                if tip not in places:
+                    places[tip] = {name: [] for name in labels}
+                places[tip][label].append(tuple(branch.stem[:-1]))
+        return {tip: found for tip, found in places.items() if sum(map(len, found.values())) > 1}
 
     def whereis(self, leaf: str,
                 value: Union[Callable[[T], bool], T] = lambda _: True) -> Dict[str, List[Tuple[str, ...]]]:
@@ -226,12 +350,13 @@ class Configuration(NSCoreMixin):
             >>> cfg.whereis('x', lambda v: v % 3 == 0)
             {'one': [('b',)], 'two': []}
         """
-        namespaces = Namespace({**self.namespaces, '_': self.local})
-        return {name: space.whereis(leaf, value) for name, space in namespaces.items()}
+        return {name: space.whereis(leaf, value) for name, space in self._iter_namespaces()}
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Intercept parameter assignment."""
-        if name in self:
+        if name in _INTERNAL_ATTRIBUTES:
+            object.__setattr__(self, name, value)
+        elif name in self:
             self.update({name: value})
         else:
             super().__setattr__(name, value)
@@ -14,12 +14,10 @@ TODO:
 
 # type annotations
 from __future__ import annotations
-from typing import Tuple, List, Dict, Callable, Optional, Any
+from typing import Tuple, List, Dict, Callable, Optional, Iterable, Any, TypeVar
 
 # standard libs
-import copy
-from collections import Counter
-from functools import reduce
+from collections import defaultdict
 
 # internal libs
 from cmdkit.config import Configuration
@@ -28,6 +26,39 @@ from cmdkit.namespace import Namespace, _find_the_leaves
 # public interface
 __all__ = ['BuilderNamespace', 'BuilderConfiguration', ]
 
+# type aliases
+T = TypeVar('T', bound=dict)
+
+
+def _follow_the_stem(tree: dict, stem: Iterable[str]) -> Any:
+    """Descend the `tree` along each branch in the `stem`."""
+    for branch in stem:
+        tree = tree[branch]
+    return tree
+
+
+def _clone_the_tree(tree: T) -> T:
+    """Copy the branches of the `tree` (preserving their types) and list leaves, sharing other leaves."""
+    clone = tree.__class__.__new__(tree.__class__)
+    for branch, branches in tree.items():
+        if isinstance(branches, dict):
+            branches = _clone_the_tree(branches)
+        elif isinstance(branches, list):
+            branches = list(branches)
+        dict.__setitem__(clone, branch, branches)
+    return clone
+
+
+def _group_the_leaves(tree: Namespace,
+                      function: Optional[Callable[[str], bool]] = None) -> Dict[str, List[Tuple[str, ...]]]:
+    """Map each leaf name to the paths where it is found, in a single pass over the `tree`."""
+    ignore = function if function is not None else lambda _: False
+    paths = defaultdict(list)
+    for _, stem in _find_the_leaves(tree):
+        if not ignore(stem[-1]):
+            paths[stem[-1]].append(tuple(stem[:-1]))
+    return paths
+
 
 class BuilderNamespace(Namespace):
     """A Namespace provider, with added methods for creating new-like Namespaces."""
@@ -47,9 +78,8 @@ class BuilderNamespace(Namespace):
             >>> ns.duplicates(lambda t: t in {'x', })
             {}
         """
-        ignore = function if function is not None else lambda _: False
-        tips = [tip for _, (*_, tip) in _find_the_leaves(self) if not ignore(tip)]
-        return {tip: self.whereis(tip) for tip, count in Counter(tips).items() if count > 1}
+        paths = _group_the_leaves(self, function)
+        return {tip: branches for tip, branches in paths.items() if len(branches) > 1}
 
     def trim(self, function: Optional[Callable[[str], bool]] = None, *,
              key: Optional[Callable[[Tuple[str, ...]], Any]] = None, reverse: bool = False) -> Namespace:
@@ -73,11 +103,11 @@ class BuilderNamespace(Namespace):
             >>> ns.trim(key=lambda t: chr(ord('z') - ord(t[0]) + ord('a')))
             BuilderNamespace({'a': {'y': 2}, 'b': {'x': 3, 'z': 4}})
         """
-        space = copy.deepcopy(self)
+        space = _clone_the_tree(self)
         for name, paths in space.duplicates(function).items():
             _, *duplicates = sorted(paths, key=key, reverse=reverse)
             for path in duplicates:
-                reduce(lambda branch, leaf: branch[leaf], path, space).pop(name)
+                _follow_the_stem(space, path).pop(name)
         return space
 
 
@@ -97,10 +127,14 @@ class BuilderConfiguration(Configuration):
             >>> cfg.duplicates()
             {'x': {'one': [('a',), ('b',)], 'two': [('b',)]}, 'z': {'one': [('b',)], 'two': [('b',)]}}
         """
-        ignore = function if function is not None else lambda _: False
-        namespaces = Namespace({**self.namespaces, '_': self.local})
-        tips = [tip for _, (*_, tip) in _find_the_leaves(namespaces) if not ignore(tip)]
-        return {tip: self.whereis(tip) for tip, count in Counter(tips).items() if count > 1}
+        namespaces = dict(self._iter_namespaces())
+        duplicates = {}
+        for tip, branches in _group_the_leaves(namespaces, function).items():
+            if len(branches) > 1:
+                duplicates[tip] = {name: [] for name in namespaces}
+                for name, *path in branches:
+                    duplicates[tip][name].append(tuple(path))
+        return duplicates
 
     def trim(self, function: Optional[Callable[[str], bool]] = None, *,
              key: Callable[[Tuple[str, ...]], Any] = None, reverse: bool = False,
@@ -141,19 +175,19 @@ class BuilderConfiguration(Configuration):
             BuilderConfiguration(one=Namespace({'a': {'x': 1, 'y': 2}, 'b': {'z': 4}}),
                                  two=Namespace({'b': {}, 'c': {'j': True, 'k': 3.14}}), alt=Namespace({}))
         """
-        lookup = lambda path, source: reduce(lambda branch, leaf: branch[leaf], path, source)
         if ordered:
-            order = list(Namespace({**self.namespaces, '_': self.local}).keys())
-            if reversed: order.reverse()
-            key = lambda a: order.index(a[0])
-        config = copy.deepcopy(self)
+            # NOTE: later namespaces take precedence and sort first (`reverse` flips this below)
+            precedence = {label: -index for index, (label, _) in enumerate(self._iter_namespaces())}
+            key = lambda a: precedence[a[0]]
+        config = _clone_the_tree(self)
+        config.__dict__.update(local=_clone_the_tree(self.local), namespaces=_clone_the_tree(self.namespaces))
         for name, spaces in config.duplicates(function).items():
             paths = [(space, *path) for space, paths in spaces.items() for path in paths]
             (unique_space, *unique_path), *duplicates = sorted(paths, key=key, reverse=reverse)
             for space, *path in duplicates:
                 if path:
-                    lookup(path, config.namespaces[space]).pop(name)
-                    lookup(path[1:], config[path[0]]).pop(name, None)
+                    _follow_the_stem(config.namespaces[space], path).pop(name)
+                    _follow_the_stem(config[path[0]], path[1:]).pop(name, None)
                 else:
                     if space == '_':
                         config.local.pop(name)
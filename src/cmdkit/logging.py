@@ -166,6 +166,14 @@ def solve_relative_time(elapsed: float) -> Tuple[float, int, datetime.timedelta,
     )
 
 
+# Formatting attributes shared by every LogRecord (empty if colors are disabled)
+_ANSI_ATTRIBUTES: Dict[str, str] = {
+    f'ansi_{name}': Ansi[name.upper()].value if COLOR_STDERR else ''
+    for name in ('reset', 'bold', 'faint', 'italic', 'underline', 'black', 'red',
+                 'green', 'yellow', 'blue', 'magenta', 'cyan', 'white')
+}
+
+
 class LogRecord(logging.LogRecord):
     """Extends standard `logging.LogRecord` to include ANSI colors, time formats, and other attributes."""
 
@@ -178,26 +186,14 @@ class LogRecord(logging.LogRecord):
         self.hostname_short = HOSTNAME_SHORT
 
         # Guard against `logging.makeLogRecord` passing None (see Issue #20)
-        if isinstance(self.name, str):
+        try:
             self.relative_name = self.name.split('.', 1)[-1]
-        else:
+        except (AttributeError, TypeError):
             self.relative_name = None
 
         # Formatting attributes
-        self.ansi_level = level_color.get(self.levelname, Ansi.NULL).value if COLOR_STDERR else ''
-        self.ansi_reset = Ansi.RESET.value if COLOR_STDERR else ''
-        self.ansi_bold = Ansi.BOLD.value if COLOR_STDERR else ''
-        self.ansi_faint = Ansi.FAINT.value if COLOR_STDERR else ''
-        self.ansi_italic = Ansi.ITALIC.value if COLOR_STDERR else ''
-        self.ansi_underline = Ansi.UNDERLINE.value if COLOR_STDERR else ''
-        self.ansi_black = Ansi.BLACK.value if COLOR_STDERR else ''
-        self.ansi_red = Ansi.RED.value if COLOR_STDERR else ''
-        self.ansi_green = Ansi.GREEN.value if COLOR_STDERR else ''
-        self.ansi_yellow = Ansi.YELLOW.value if COLOR_STDERR else ''
-        self.ansi_blue = Ansi.BLUE.value if COLOR_STDERR else ''
-        self.ansi_magenta = Ansi.MAGENTA.value if COLOR_STDERR else ''
-        self.ansi_cyan = Ansi.CYAN.value if COLOR_STDERR else ''
-        self.ansi_white = Ansi.WHITE.value if COLOR_STDERR else ''
+        self.ansi_level = '' if not COLOR_STDERR else level_color.get(self.levelname, Ansi.NULL).value
+        self.__dict__.update(_ANSI_ATTRIBUTES)
 
         # Timing attributes
         (self.elapsed,
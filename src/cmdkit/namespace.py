@@ -6,15 +6,14 @@
 
 # type annotations
 from __future__ import annotations
-from typing import Union, Mapping, Iterable, Any, Dict, Optional, IO, List, Tuple, Callable, TypeVar, NamedTuple
+from typing import Union, Iterable, Any, Dict, Optional, IO, List, Tuple, Callable, TypeVar, NamedTuple
 
 # standard libs
 import os
 import sys
 import functools
 import subprocess
-from collections import Counter
-from functools import reduce
+from collections.abc import Mapping  # NOTE: much faster isinstance checks than typing.Mapping
 
 # public interface
 __all__ = [
@@ -29,12 +28,12 @@ T = TypeVar('T')
 
 def _as_namespace(ns: T) -> Union[T, Namespace]:
     """If `ns` is a mappable, coerce to Namespace, recursively, otherwise pass."""
-    return ns if not isinstance(ns, Mapping) else Namespace({k: _as_namespace(v) for k, v in dict(ns).items()})
+    return ns if not isinstance(ns, Mapping) else Namespace(ns)  # NOTE: Namespace.__init__ recurses
 
 
 def _as_dict(ns: NSCoreMixin) -> dict:
     """If `ns` is a mappable, coerce to dict, recursively, otherwise pass."""
-    return {k: v if not isinstance(v, Mapping) else _as_dict(v) for k, v in dict(ns).items()}
+    return {k: v if not isinstance(v, Mapping) else _as_dict(v) for k, v in ns.items()}
 
 
 class NSCoreMixin(dict):
@@ -43,15 +42,19 @@ class NSCoreMixin(dict):
     def __init__(self, *args: Union[Iterable, Mapping], **kwargs: Any) -> None:
         """Initialize from same signature as `dict`."""
         super().__init__()
-        for k, v in dict(*args, **kwargs).items():
-            self[k] = _as_namespace(v)
+        if len(args) == 1 and not kwargs and isinstance(args[0], Mapping):
+            source = args[0]  # NOTE: common case needs no intermediate copy
+        else:
+            source = dict(*args, **kwargs)
+        for key, value in source.items():
+            dict.__setitem__(self, key, _as_namespace(value))
 
     def __setitem__(self, key: str, value: Any) -> None:
         """Strip special type if `value` is Namespace-like."""
         if not isinstance(value, Mapping):
             super().__setitem__(key, value)
         else:
-            super().__setitem__(key, _as_namespace(dict(value)))
+            super().__setitem__(key, _as_namespace(value))
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Alias for index notation (if already present)."""
@@ -75,32 +78,28 @@ class NSCoreMixin(dict):
 
     def update(self, *args, **kwargs) -> None:
         """Depth-first update method."""
-        self.__depth_first_update(self, dict(*args, **kwargs))
+        if len(args) == 1 and not kwargs and isinstance(args[0], Mapping):
+            self.__depth_first_update(self, args[0])
+        else:
+            self.__depth_first_update(self, dict(*args, **kwargs))
 
     def __getattr__(self, item: str) -> Any:
         """
         Alias for index notation.
         Transparently expand `_env` and `_eval` variants.
         """
-        getters = {f'{item}': (lambda: self[item]),
-                   f'{item}_env': functools.partial(self.__expand_attr_env, item),
-                   f'{item}_eval': functools.partial(self.__expand_attr_eval, item)}
-
-        items = [key for key in getters if key in self]
-        if len(items) == 0:
+        env_key, eval_key = f'{item}_env', f'{item}_eval'
+        has_env, has_eval = env_key in self, eval_key in self
+        if item in self:
+            if not has_env and not has_eval:
+                return self[item]
+        elif has_env and not has_eval:
+            return os.getenv(str(self[env_key]), None)
+        elif has_eval and not has_env:
+            return subprocess.check_output(str(self[eval_key]), shell=True).decode().strip()
+        elif not has_env:
             raise AttributeError(f'\'{item}\' not found')
-        elif len(items) == 1:
-            return getters[items[0]]()
-        else:
-            raise AttributeError(f'\'{item}\' has more than one variant')
-
-    def __expand_attr_env(self, item: str) -> str:
-        """Expand `item` as an environment variable."""
-        return os.getenv(str(self[f'{item}_env']), None)
-
-    def __expand_attr_eval(self, item: str) -> str:
-        """Expand `item` as a shell expression."""
-        return subprocess.check_output(str(self[f'{item}_eval']), shell=True).decode().strip()
+        raise AttributeError(f'\'{item}\' has more than one variant')
 
     def __repr__(self) -> str:
         """Convert to string representation."""
@@ -167,11 +166,12 @@ class Namespace(NSCoreMixin):
     def from_yaml(cls, path_or_file: Union[str, IO], **options) -> Namespace:
         """Load a namespace from a YAML file."""
         import yaml
+        loader = getattr(yaml, 'CFullLoader', yaml.FullLoader)  # NOTE: LibYAML bindings if available
         if isinstance(path_or_file, str):
             with open(path_or_file, mode='r', **options) as source:
-                return cls(yaml.load(source, Loader=yaml.FullLoader))
+                return cls(yaml.load(source, Loader=loader))
         else:
-            return cls(yaml.load(path_or_file, Loader=yaml.FullLoader))
+            return cls(yaml.load(path_or_file, Loader=loader))
 
     @classmethod
     def from_toml(cls, path_or_file: Union[str, IO], **options) -> Namespace:
@@ -284,8 +284,10 @@ class Namespace(NSCoreMixin):
             >>> ns.duplicates()
             {'x': [('a',), ('b',)]}
         """
-        tips = [tip for _, (*_, tip) in _find_the_leaves(self)]
-        return {tip: self.whereis(tip) for tip, count in Counter(tips).items() if count > 1}
+        paths: Dict[str, List[Tuple[str, ...]]] = {}
+        for branch in _find_the_leaves(self):
+            paths.setdefault(branch.stem[-1], []).append(tuple(branch.stem[:-1]))
+        return {tip: found for tip, found in paths.items() if len(found) > 1}
 
     def whereis(self, leaf: str, value: Union[Callable[[T], bool], T] = lambda _: True) -> List[Tuple[str, ...]]:
         """
@@ -313,21 +315,23 @@ class Namespace(NSCoreMixin):
 _VT = TypeVar('_VT', str, int, float, bool, type(None))
 
 
+# Special values (case-insensitive) for `_coerced`
+_SPECIAL: Dict[str, Optional[bool]] = {'': None, 'null': None, 'true': True, 'false': False}
+
+
+@functools.lru_cache(maxsize=256)
 def _coerced(var: str) -> _VT:
     """Automatically coerce input `var` to numeric if possible."""
-    if var.lower() in ('', 'null'):
-        return None
-    if var.lower() == 'true':
-        return True
-    if var.lower() == 'false':
-        return False
+    lowered = var.lower()
+    if lowered in _SPECIAL:
+        return _SPECIAL[lowered]
     try:
         return int(var)
-    except (ValueError, TypeError):
+    except ValueError:
         pass
     try:
         return float(var)
-    except (ValueError, TypeError):
+    except ValueError:
         return var
 
 
@@ -344,18 +348,19 @@ def _de_coerced(var: _VT) -> str:
 
 
 def _flatten(ns: dict, prefix: str = None) -> dict:
-    """Helper function recursively normalizes a dictionary to depth-1."""
+    """Helper function normalizes a dictionary to depth-1, in a single depth-first pass."""
     new = {}
-    for key, value in dict(ns).items():
-        if not isinstance(value, dict):
-            new[key.upper()] = _de_coerced(value)
+    branches = [(iter(ns.items()), '' if prefix is None else f'{prefix}_')]
+    while branches:
+        items, stem = branches[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                branches.append((iter(value.items()), f'{stem}{key.upper()}_'))
+                break  # NOTE: `items` resumes here once the sub-tree is finished
+            new[f'{stem}{key.upper()}'] = _de_coerced(value)
         else:
-            for subkey, subvalue in _flatten(value).items():
-                new['_'.join([key.upper(), subkey.upper()])] = _de_coerced(subvalue)
-    if prefix is None:
-        return new
-    else:
-        return {f'{prefix}_{key}': value for key, value in new.items()}
+            branches.pop()
+    return new
 
 
 class _Leaf(NamedTuple):
@@ -365,31 +370,19 @@ class _Leaf(NamedTuple):
 
 
 def _find_the_leaves(tree: Optional[Mapping[str, Any]]) -> List[_Leaf]:
-    """Return the leaves (and their stems) of the tree (e.g., Namespace)."""
+    """Return the leaves (and their stems) of the tree (e.g., Namespace), in a single depth-first pass."""
     leaves = []
     if tree is not None:
-        leaves = [_Leaf(_read_a_leaf(stem, tree), stem) for stem in _walk_the_tree(tree)]
-    return leaves
-
-
-def _read_a_leaf(stem: List[str], tree: Mapping[str, Any]) -> Optional[Any]:
-    """Read the leaf at the end of the stem on the tree (e.g., Namespace)."""
-    try:
-        return reduce(lambda branch, leaf: branch[leaf], stem, tree)
-    except KeyError:
-        return None
-
-
-def _walk_the_tree(tree: Mapping[str, Any], stem: List[str] = None) -> List[List[str]]:
-    """Return the leaves of the branches."""
-    stem = stem or []
-    leaves = []
-    for branch, branches in tree.items():
-        leaf = stem + [branch, ]
-        if isinstance(branches, dict):
-            leaves.extend(_walk_the_tree(branches, leaf))
-        else:
-            leaves.append(leaf)
+        branches = [(iter(tree.items()), [])]
+        while branches:
+            items, stem = branches[-1]
+            for branch, value in items:
+                if isinstance(value, dict):
+                    branches.append((iter(value.items()), stem + [branch, ]))
+                    break  # NOTE: `items` resumes here once the sub-tree is finished
+                leaves.append(_Leaf(value, stem + [branch, ]))
+            else:
+                branches.pop()
     return leaves
 
 
@@ -416,8 +409,9 @@ class Environ(NSCoreMixin):
         super().__init__(defaults or {})
         self._prefix = prefix
         if prefix is not None:
-            self.update({name: value for name, value in os.environ.items()
-                         if name.startswith(prefix)})
+            # NOTE: values are always strings, so there is nothing to merge or convert
+            dict.update(self, ((name, value) for name, value in os.environ.items()
+                               if name.startswith(prefix)))
 
     def expand(self, converter: Callable[[str], Any] = None) -> Environ:
         """
@@ -439,16 +433,17 @@ class Environ(NSCoreMixin):
         ======================== ========================
         """
         coerced = converter or _coerced
-        partial = Namespace({})
+        tree = {}
         offset = len(self._prefix) + 1
         for key, value in self.items():
-            sections = key[offset:].split('_')
-            base = {}
-            reduce(lambda d, k: d.setdefault(k.lower(), {}),
-                   sections[:-1], base)[sections[-1].lower()] = coerced(value)
-            partial.update(base)
-        ns = Environ()
-        ns.update(partial)
+            *sections, leaf = key[offset:].lower().split('_')
+            branch = tree
+            for section in sections:
+                if not isinstance(branch.get(section), dict):
+                    branch[section] = {}  # NOTE: later variables replace conflicting values
+                branch = branch[section]
+            branch[leaf] = coerced(value)
+        ns = Environ(defaults=tree)
         ns._prefix = self._prefix
         return ns
 
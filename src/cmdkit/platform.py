@@ -11,8 +11,10 @@ from typing import Tuple, Type, Final
 # standard libs
 import os
 import re
+import sys
 import ctypes
 import platform
+import functools
 from dataclasses import dataclass
 
 # internal libs
@@ -26,7 +28,12 @@ CWD: Final[str] = os.getcwd()
 HOME: Final[str] = os.path.expanduser('~')
 
 
-@dataclass
+# Valid application names (used in file paths and environment variables)
+_APPNAME_RE: Final[re.Pattern] = re.compile(r'[a-zA-Z0-9_-]+\Z')
+
+
+# NOTE: slots are only supported by dataclasses on Python 3.10+
+@dataclass(**({'slots': True} if sys.version_info >= (3, 10) else {}))
 class AppContext:
     """
     Runtime application context.
@@ -51,20 +58,17 @@ class AppContext:
                 config_format: str = 'toml') -> AppContext:
         """Define default context with platform-specific paths."""
 
-        if not re.match(r'[a-zA-Z0-9_-]+$', name):
+        if not _APPNAME_RE.match(name):
             raise ValueError(f'Invalid application name, \'{name}\'')
 
         site_var = f'{name.upper()}_SITE'
         local_site = os.getenv(site_var, os.path.join(CWD, f'.{name.lower()}'))
 
-        if platform.system() == 'Windows':
-            is_admin, path = _get_windows_paths(name, config_format, local_site)
-        elif platform.system() == 'Darwin':
-            is_admin, path = _get_darwin_paths(name, config_format, local_site)
-        elif os.name == 'posix':
-            is_admin, path = _get_posix_paths(name, config_format, local_site)
-        else:
-            raise RuntimeError(f'Unrecognized platform: {platform.system()} ({os.name})')
+        system = platform.system()
+        is_admin = _check_admin(system)
+        roots = _get_environ_roots(system)
+        path = _get_platform_paths(system, name, config_format, local_site, is_admin, roots)
+        path = Namespace(path)  # NOTE: copy of cached paths, callers may modify their context
 
         if site_var in os.environ:
             default_site = 'local'
@@ -81,12 +85,46 @@ class AppContext:
                    default_site=default_site, default_path=default_path, path=path)
 
 
-def _get_posix_paths(name: str, config_format: str, local_site: str) -> Tuple[bool, Namespace]:
+def _check_admin(system: str) -> bool:
+    """True if the current user has administrative privileges."""
+    if system == 'Windows':
+        return ctypes.windll.shell32.IsUserAnAdmin() == 1
+    elif system == 'Darwin' or os.name == 'posix':
+        return os.getuid() == 0
+    else:
+        return False  # NOTE: unrecognized platform, raised on when defining paths
+
+
+def _get_environ_roots(system: str) -> Tuple[str, ...]:
+    """Site roots taken from the environment for the given platform `system`."""
+    if system == 'Windows':
+        return os.getenv('ProgramData'), os.getenv('AppData')
+    else:
+        return ()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_platform_paths(system: str, name: str, config_format: str, local_site: str,
+                        is_admin: bool, roots: Tuple[str, ...]) -> Namespace:
+    """
+    Define paths for the given platform `system` (cached, do not modify).
+    Everything the paths are derived from is passed in so that it forms part of the cache key.
+    """
+    if system == 'Windows':
+        return _get_windows_paths(name, config_format, local_site, *roots)
+    elif system == 'Darwin':
+        return _get_darwin_paths(name, config_format, local_site)
+    elif os.name == 'posix':
+        return _get_posix_paths(name, config_format, local_site)
+    else:
+        raise RuntimeError(f'Unrecognized platform: {system} ({os.name})')
+
+
+def _get_posix_paths(name: str, config_format: str, local_site: str) -> Namespace:
     """Define paths for generic Posix systems (e.g., Linux)."""
     name_lower = name.lower()
-    is_admin = os.getuid() == 0
     site = dict(system='/', user=os.path.join(HOME, f'.{name_lower}'), local=local_site)
-    path = dict({
+    path = {
         'system': {
             'lib': os.path.join(site['system'], 'var', 'lib', name_lower),
             'log': os.path.join(site['system'], 'var', 'log', name_lower),
@@ -98,16 +136,15 @@ def _get_posix_paths(name: str, config_format: str, local_site: str) -> Tuple[bo
         'local': {
             'lib': os.path.join(site['local'], 'lib'),
             'log': os.path.join(site['local'], 'log'),
-            f'config': os.path.join(site['local'], f'config.{config_format}')}
-    })
-    return is_admin, Namespace(path)
+            'config': os.path.join(site['local'], f'config.{config_format}')}
+    }
+    return Namespace(path)
 
 
-def _get_darwin_paths(name: str, config_format: str, local_site: str) -> Tuple[bool, Namespace]:
+def _get_darwin_paths(name: str, config_format: str, local_site: str) -> Namespace:
     """Define paths for Darwin systems (i.e., macOS)."""
-    is_admin = os.getuid() == 0
     site = dict(system='/', user=HOME, local=local_site)
-    path = dict({
+    path = {
         'system': {
             'lib': os.path.join(site['system'], 'Library', name),
             'log': os.path.join(site['system'], 'Library', 'Logs', name),
@@ -120,17 +157,17 @@ def _get_darwin_paths(name: str, config_format: str, local_site: str) -> Tuple[b
             'lib': os.path.join(site['local'], 'Library'),
             'log': os.path.join(site['local'], 'Logs'),
             'config': os.path.join(site['local'], f'config.{config_format}')}
-    })
-    return is_admin, Namespace(path)
+    }
+    return Namespace(path)
 
 
-def _get_windows_paths(name: str, config_format: str, local_site: str) -> Tuple[bool, Namespace]:
+def _get_windows_paths(name: str, config_format: str, local_site: str,
+                       program_data: str, app_data: str) -> Namespace:
     """Define paths for Windows systems (NT)."""
-    is_admin = ctypes.windll.shell32.IsUserAnAdmin() == 1
-    site = dict(system=os.path.join(os.getenv('ProgramData'), name),
-                user=os.path.join(os.getenv('AppData'), name),
+    site = dict(system=os.path.join(program_data, name),
+                user=os.path.join(app_data, name),
                 local=local_site)
-    path = dict({
+    path = {
         'system': {
             'lib': os.path.join(site['system'], 'Library'),
             'log': os.path.join(site['system'], 'Logs'),
@@ -143,5 +180,5 @@ def _get_windows_paths(name: str, config_format: str, local_site: str) -> Tuple[
             'lib': os.path.join(site['local'], 'Library'),
             'log': os.path.join(site['local'], 'Logs'),
             'config': os.path.join(site['local'], f'Config.{config_format}')}
-    })
-    return is_admin, Namespace(path)
+    }
+    return Namespace(path)
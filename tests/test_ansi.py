@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2022 CmdKit Developers
+# SPDX-License-Identifier: Apache-2.0
+
+"""Unit tests for `cmdkit.ansi` behavior and interfaces."""
+
+
+# external libs
+import pytest
+
+# internal libs
+from cmdkit import ansi
+from cmdkit.ansi import Ansi, colorize_usage
+
+
+RESET = Ansi.RESET.value
+
+
+@pytest.fixture
+def force_color(monkeypatch) -> None:
+    """Enable colors regardless of TTY status."""
+    monkeypatch.setattr(ansi, 'COLOR_STDOUT', True)
+
+
+@pytest.fixture
+def no_color(monkeypatch) -> None:
+    """Disable colors regardless of TTY status."""
+    monkeypatch.setattr(ansi, 'COLOR_STDOUT', False)
+
+
+def test_colorize_usage_disabled(no_color) -> None:
+    """Text passes through unchanged when colors are disabled."""
+    text = 'Usage:\n  demo [-h] FILE'
+    assert colorize_usage(text) == text
+
+
+def test_colorize_usage_headers(force_color) -> None:
+    """Section headers are bold."""
+    assert colorize_usage('Options:') == f'{Ansi.BOLD.value}Options:{RESET}'
+
+
+def test_colorize_usage_options(force_color) -> None:
+    """Options are cyan (but not their leading character)."""
+    assert colorize_usage('[-h | --help]') == (
+        f'[{Ansi.CYAN.value}-h{RESET} | {Ansi.CYAN.value}--help{RESET}]'
+    )
+
+
+def test_colorize_usage_special_names(force_color) -> None:
+    """Metavars, devices, and reserved names are italic; numbers are green."""
+    italic, green = Ansi.ITALIC.value, Ansi.GREEN.value
+    assert colorize_usage('FILE <stdout> localhost 42') == (
+        f'{italic}FILE{RESET} {italic}<stdout>{RESET} {italic}localhost{RESET} {green}42{RESET}'
+    )
+
+
+def test_colorize_usage_quoted(force_color) -> None:
+    """Quoted text is formatted as a whole and nothing inside is formatted separately."""
+    yellow = Ansi.YELLOW.value
+    assert colorize_usage('use "NAME --opt 42" or `-x`') == (
+        f'use {yellow}"NAME --opt 42"{RESET} or {yellow}`-x`{RESET}'
+    )
+
+
+@pytest.mark.parametrize('name', ['bold', 'faint', 'italic', 'underline', 'black', 'red',
+                                  'green', 'yellow', 'blue', 'magenta', 'cyan', 'white'])
+@pytest.mark.parametrize('text', ['text', f'{Ansi.RED.value}text{RESET}'])
+def test_shorthand_matches_format_ansi(force_color, name: str, text: str) -> None:
+    """Shorthand methods are equivalent to calling format_ansi directly."""
+    assert getattr(ansi, name)(text) == ansi.format_ansi(Ansi[name.upper()], text)
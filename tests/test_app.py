@@ -71,6 +71,11 @@ class FileAppWithExceptionHandling(FileApp):
     exceptions = {FileNotFoundError: (lambda exc: 1)}
 
 
+class FileAppWithLayeredExceptionHandling(FileApp):
+    """FileApp uses the first matching handler (in order) for FileNotFoundError."""
+    exceptions = {Exception: (lambda exc: 3), OSError: (lambda exc: 2), FileNotFoundError: (lambda exc: 1)}
+
+
 def test_app_noargs(capsys) -> None:
     """Initialize and run the application."""
     with pytest.raises(ArgumentError):
@@ -166,12 +171,32 @@ def test_app_invalid_options(opt):
                 pass
 
 
+def test_interface_skips_formatting() -> None:
+    """Empty or already formatted text is not passed to the formatter."""
+    formatted = []
+    def formatter(text: str) -> str:
+        formatted.append(text)
+        return text.upper()
+    interface = Interface(DEMO_NAME, '', '\033[1mHelp:\033[0m', formatter=formatter)
+    assert interface.usage_text == ''
+    assert interface.help_text == '\033[1mHelp:\033[0m'
+    assert formatted == []
+    interface = Interface(DEMO_NAME, DEMO_USAGE, DEMO_HELP, formatter=formatter)
+    assert interface.usage_text == DEMO_USAGE.upper()
+    assert formatted == [DEMO_USAGE, ]  # NOTE: help text is not formatted until needed
+    assert interface.help_text == DEMO_HELP.upper()
+    assert interface.help_text == DEMO_HELP.upper()
+    assert formatted == [DEMO_USAGE, DEMO_HELP]
+
+
 def test_app_exceptions() -> None:
     """Test exception handling."""
     with pytest.raises(FileNotFoundError):
         FileApp.main(['-'])
     status = FileAppWithExceptionHandling.main(['-'])
     assert status == 1
+    status = FileAppWithLayeredExceptionHandling.main(['-'])
+    assert status == 3
 
 
 CMD1 = 'aaaa'
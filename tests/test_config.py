@@ -6,6 +6,9 @@
 
 # standard libs
 import os
+import pickle
+import shutil
+import tempfile
 from io import StringIO
 from string import ascii_letters
 
@@ -13,8 +16,10 @@ from string import ascii_letters
 import pytest
 
 # internal libs
+from cmdkit import config
 from cmdkit.config import Configuration
 from cmdkit.namespace import Namespace, Environ
+from cmdkit.platform import AppContext
 
 # ensure temporary directory exists
 TMPDIR = '/tmp/cmdkit/config'
@@ -571,6 +576,127 @@ class TestConfiguration:
         assert cfg['c']['var4'] == 'env_var4' and cfg.which('c', 'var4') == 'env'
         assert cfg['c']['var5'] == 'env_var5' and cfg.which('c', 'var5') == 'env'
 
+    def test_from_local_reparse_on_change(self) -> None:
+        """Configuration.from_local only re-parses files that have changed."""
+
+        filepath = f'{TMPDIR}/cached.toml'
+        with open(filepath, mode='w') as output:
+            output.write('[a]\nx = 1\ny = [1, 2]\n')
+
+        cfg = Configuration.from_local(main=filepath)
+        assert cfg.namespaces['main'] == {'a': {'x': 1, 'y': [1, 2]}}
+
+        # modifying the result does not modify the cached copy
+        cfg.namespaces['main']['a']['y'].append(3)
+        cfg = Configuration.from_local(main=filepath)
+        assert cfg.namespaces['main'] == {'a': {'x': 1, 'y': [1, 2]}}
+
+        with open(filepath, mode='w') as output:
+            output.write('[a]\nx = 42\n')
+
+        cfg = Configuration.from_local(main=filepath)
+        assert cfg.namespaces['main'] == {'a': {'x': 42}}
+
+        Configuration.clear_parse_cache()
+        cfg = Configuration.from_local(main=filepath)
+        assert cfg.namespaces['main'] == {'a': {'x': 42}}
+
+    def test_from_local_unreachable(self) -> None:
+        """Configuration.from_local skips files that cannot exist (e.g., under a regular file)."""
+        filepath = f'{TMPDIR}/not_a_directory.toml'
+        with open(filepath, mode='w') as output:
+            output.write('[a]\nx = 1\n')
+        cfg = Configuration.from_local(main=f'{filepath}/config.toml')
+        assert cfg.namespaces['main'] == {}
+
+    def test_from_local_persistent_cache(self, monkeypatch, tmp_path) -> None:
+        """Configuration.from_local reuses parsed files across processes if enabled."""
+
+        filepath = f'{TMPDIR}/persistent.toml'
+        with open(filepath, mode='w') as output:
+            output.write('[a]\nx = 1\ny = [1, 2]\n')
+
+        monkeypatch.setenv('CMDKIT_CONFIG_CACHE', '1')
+        monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+        Configuration.clear_parse_cache()
+        cfg = Configuration.from_local(main=filepath)
+        assert cfg.namespaces['main'] == {'a': {'x': 1, 'y': [1, 2]}}
+        assert len(list(tmp_path.glob('cmdkit-cfg*/*.pkl'))) == 1
+
+        # simulate a new process; the file must not be parsed again
+        Configuration.clear_parse_cache()
+        with monkeypatch.context() as patch:
+            patch.setattr(Namespace, 'from_local', lambda *_, **__: pytest.fail('parsed again'))
+            cfg = Configuration.from_local(main=filepath)
+        assert isinstance(cfg.namespaces['main']['a'], Namespace)
+        assert cfg.namespaces['main'] == {'a': {'x': 1, 'y': [1, 2]}}
+
+        # out of date cache files are replaced
+        with open(filepath, mode='w') as output:
+            output.write('[a]\nx = 42\n')
+        Configuration.clear_parse_cache()
+        cfg = Configuration.from_local(main=filepath)
+        assert cfg.namespaces['main'] == {'a': {'x': 42}}
+        assert len(list(tmp_path.glob('cmdkit-cfg*/*'))) == 1
+        Configuration.clear_parse_cache()
+
+    def test_from_context_independent(self, monkeypatch) -> None:
+        """Configuration.from_context gives each caller its own application context."""
+        site = f'{TMPDIR}/site'
+        monkeypatch.setenv('CMDKIT_TEST_SITE', site)
+        ctx, _ = Configuration.from_context('cmdkit_test')
+        assert ctx.default_site == 'local'
+        assert ctx.path.local.config == f'{site}/config.toml'
+        ctx.path.local.config = 'modified'
+        shutil.rmtree(site)
+        other, _ = Configuration.from_context('cmdkit_test')
+        assert other.path.local.config == f'{site}/config.toml'
+        assert os.path.isdir(f'{site}/lib') and os.path.isdir(f'{site}/log')
+
+    @pytest.mark.skipif(os.name != 'posix', reason='checks user id')
+    def test_from_context_privileges(self, monkeypatch) -> None:
+        """AppContext.default checks privileges on every call."""
+        monkeypatch.delenv('CMDKIT_TEST_SITE', raising=False)
+        monkeypatch.setattr(os, 'getuid', lambda: 0)
+        ctx = AppContext.default('cmdkit_test', create_dirs=False)
+        assert ctx.is_admin and ctx.default_site == 'system'
+        monkeypatch.setattr(os, 'getuid', lambda: 1000)
+        ctx = AppContext.default('cmdkit_test', create_dirs=False)
+        assert not ctx.is_admin and ctx.default_site == 'user'
+
+    def test_from_local_persistent_cache_invalid(self, monkeypatch, tmp_path) -> None:
+        """Configuration.from_local parses the file if the persistent cache cannot be used."""
+
+        filepath = f'{TMPDIR}/persistent.toml'
+        with open(filepath, mode='w') as output:
+            output.write('[a]\nx = 1\n')
+
+        monkeypatch.setenv('CMDKIT_CONFIG_CACHE', '1')
+        monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+        Configuration.clear_parse_cache()
+        Configuration.from_local(main=filepath)
+        cache_path, = tmp_path.glob('cmdkit-cfg*/*.pkl')
+        with open(cache_path, mode='rb') as source:
+            header = source.read(len(config._CACHE_FORMAT))
+            rest = source.read()
+        assert header == config._CACHE_FORMAT
+
+        # written by another version of cmdkit
+        with open(cache_path, mode='wb') as output:
+            output.write(header + rest.replace(b'\0', b'\0-other-', 1))
+        Configuration.clear_parse_cache()
+        assert Configuration.from_local(main=filepath).namespaces['main'] == {'a': {'x': 1}}
+
+        # refers to a class that does not exist
+        stale = pickle.dumps(Namespace(a={'x': 2}), protocol=5).replace(b'Namespace', b'Namespacx')
+        with open(cache_path, mode='r+b') as output:
+            output.seek(len(config._persistent_cache_header((0, 0))))
+            output.write(stale)
+            output.truncate()
+        Configuration.clear_parse_cache()
+        assert Configuration.from_local(main=filepath).namespaces['main'] == {'a': {'x': 1}}
+        Configuration.clear_parse_cache()
+
     def test_live_update(self) -> None:
         """Test direct modification of configuration data."""
 
@@ -37,6 +37,15 @@ class TestBuilderNamespace:
         ns = BuilderNamespace({'a': {'x': 1, 'y': 2}, 'b': {'x': 3, 'z': 4}})
         assert ns.trim(key=lambda t: chr(ord('z') - ord(t[0]) + ord('a'))) == {'a': {'y': 2}, 'b': {'x': 3, 'z': 4}}
 
+    def test_trim_copy(self) -> None:
+        """Trimming does not modify the original."""
+        ns = BuilderNamespace({'a': {'x': 1, 'y': [2]}, 'b': {'x': 3, 'z': 4}})
+        trimmed = ns.trim()
+        assert trimmed == {'a': {'x': 1, 'y': [2]}, 'b': {'z': 4}}
+        assert isinstance(trimmed, BuilderNamespace) and isinstance(trimmed['b'], Namespace)
+        trimmed['a']['y'].append(5)
+        assert ns == {'a': {'x': 1, 'y': [2]}, 'b': {'x': 3, 'z': 4}}
+
 
 class TestBuilderConfiguration:
     """Unit tests for BuilderNamespace."""
@@ -116,3 +125,27 @@ class TestBuilderConfiguration:
                                  alt=Namespace({}), 
                                  _=Namespace({'x': 6}))
         ).__dict__.items()
+
+    def test_trim_copy(self) -> None:
+        """Trimming does not modify the original."""
+        one = Namespace({'a': {'x': 1, 'y': [2]}, 'b': {'x': 3, 'z': 4}})
+        two = Namespace({'b': {'x': 4, 'z': 2}, 'c': {'j': True, 'k': 3.14}})
+        cfg = BuilderConfiguration(one=one, two=two)
+        trimmed = cfg.trim()
+        trimmed.namespaces['one']['a']['y'].append(5)
+        trimmed['a']['y'].append(6)
+        assert cfg.namespaces == {'one': one, 'two': two}
+        assert cfg == {'a': {'x': 1, 'y': [2]}, 'b': {'x': 4, 'z': 2}, 'c': {'j': True, 'k': 3.14}}
+
+    def test_trim_ordered_reverse(self) -> None:
+        """Remove duplicates with reverse of preserved order of priority."""
+        one = Namespace({'a': {'x': 1, 'y': 2}, 'b': {'x': 3, 'z': 4}})
+        two = Namespace({'b': {'x': 4, 'z': 2}, 'c': {'j': True, 'k': 3.14}})
+        alt = Namespace({'x': 5})
+        cfg = BuilderConfiguration(one=one, two=two, alt=alt)
+        cfg.update(x=6)
+        trimmed = cfg.trim(ordered=True, reverse=True)
+        assert trimmed.namespaces == {'one': {'a': {'x': 1, 'y': 2}, 'b': {'z': 4}},
+                                      'two': {'b': {}, 'c': {'j': True, 'k': 3.14}},
+                                      'alt': {}}
+        assert trimmed.local == {}